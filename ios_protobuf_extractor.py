@@ -52,6 +52,19 @@ from pathlib import Path
 from datetime import datetime
 import argparse
 import struct
+import mmap
+import shutil
+import heapq
+from contextlib import contextmanager
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import hyperscan
+except ImportError:
+    # Optional: the string scan falls back to the re module
+    hyperscan = None
 
 # Set up logging
 logging.basicConfig(
@@ -67,6 +80,88 @@ __website__ = "http://reversesio.com/"
 __telegram__ = "https://t.me/riyadmondol2006"
 __version__ = "1.0.0"
 
+# Protobuf-related patterns. Longer names such as google.protobuf,
+# SwiftProtobuf or APIUserRequest contain one of these and are picked up
+# whole when a hit is widened to its printable run, so listing them too
+# would only add first bytes the search has to stop at.
+# No pattern may contain another: hyperscan reports hits ordered by end,
+# and only then is that also start order, which scan_protobuf_strings
+# relies on to skip hits inside a run it has already widened
+_PROTOBUF_PATTERNS = [
+    rb'\.proto',
+    rb'protobuf',
+    rb'Protobuf',
+    rb'Request',
+    rb'Response',
+    rb'Message',
+    rb'Service',
+    rb'rpc ',
+    rb'message ',
+    rb'service ',
+]
+
+# All patterns as one alternation so the binary is searched in a single pass
+_PROTOBUF_RE = re.compile(b'|'.join(_PROTOBUF_PATTERNS))
+
+# Hyperscan runs all patterns as one SIMD-accelerated automaton
+_PROTOBUF_DB = None
+if hyperscan is not None:
+    try:
+        _PROTOBUF_DB = hyperscan.Database()
+        _PROTOBUF_DB.compile(
+            expressions=_PROTOBUF_PATTERNS,
+            ids=list(range(len(_PROTOBUF_PATTERNS))),
+            elements=len(_PROTOBUF_PATTERNS),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_PROTOBUF_PATTERNS)
+        )
+    except hyperscan.error as e:
+        # e.g. a CPU without the instruction set the library was built for
+        logger.warning("Hyperscan unavailable, using re for string scans: %s", e)
+        _PROTOBUF_DB = None
+
+# Identifier tokens inside a matched run that may be message or service
+# names, e.g. UserRequest in "my.pkg.UserRequest" or "UserRequest failed: %s"
+_NAME_TOKEN_RE = re.compile(rb'[A-Za-z0-9_]*(?:Request|Response|Message|Service)[A-Za-z0-9_]*')
+_MESSAGE_KIND_RE = re.compile(rb'Request|Response|Message')
+
+# Greedy scan back to the last non-printable byte before a match
+_RUN_START_RE = re.compile(rb'.*[^\x20-\x7e]', re.DOTALL)
+_RUN_END_RE = re.compile(rb'[\x20-\x7e]*')
+_PRINTABLE_RE = re.compile(rb'[\x20-\x7e]+')
+
+# Protobuf descriptor signatures as (signature, has_trailing_tag): a trailing
+# tag is followed by a varint length, otherwise the last byte is the length
+_DESCRIPTOR_SIGNATURES = [
+    (b'\x08\x96\x01\x12', True),   # Common protobuf descriptor pattern
+    (b'\x0a\x04', False),            # String field pattern
+    (b'\x12\x04', False),            # Another common pattern
+]
+
+# Mach-O constants
+_FAT_MAGIC = 0xcafebabe
+_FAT_MAGIC_64 = 0xcafebabf
+_MH_MAGIC = 0xfeedface
+_MH_MAGIC_64 = 0xfeedfacf
+_LC_SEGMENT = 0x1
+_LC_SEGMENT_64 = 0x19
+_CPU_TYPE_ARM64 = 0x0100000c
+
+# Mach-O sections holding C strings, class names and constant data, where
+# protobuf names and serialized descriptors live
+_MACHO_SCAN_SECTIONS = {
+    (b'__TEXT', b'__cstring'),
+    (b'__TEXT', b'__const'),
+    (b'__TEXT', b'__objc_classname'),
+    (b'__DATA', b'__const'),
+    (b'__DATA_CONST', b'__const'),
+}
+
+# Top-level app bundle directory inside an IPA
+_APP_BUNDLE_RE = re.compile(r'Payload/[^/]+\.app/')
+
+# Protobuf message/service name: capitalized identifier of 3-100 characters
+_VALID_NAME = re.compile(r'\A[A-Z][A-Za-z0-9_]{2,99}\Z').match
+
 def print_banner():
     """Print tool banner with author information"""
     banner = f"""
@@ -105,6 +200,185 @@ def print_footer():
     """
     print(footer)
 
+@contextmanager
+def _map_file(path):
+    """Memory-map a file read-only so it can be scanned without copying it"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map empty files
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+def _walk_files(root):
+    """Recursively yield os.DirEntry objects for files under root"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            else:
+                yield entry
+
+def _is_framework_binary(parts):
+    """Check if app bundle path parts name a framework binary: Frameworks/<name>.framework/<name>"""
+    return (len(parts) == 3 and parts[0] == 'Frameworks'
+            and parts[1] == parts[2] + '.framework')
+
+def _macho_slice_offset(data):
+    """Return the file offset of the Mach-O image to scan, preferring arm64 in fat binaries"""
+    if len(data) < 8:
+        return None
+    magic, nfat_arch = struct.unpack_from('>II', data, 0)
+    if magic not in (_FAT_MAGIC, _FAT_MAGIC_64):
+        return 0
+    
+    # Fat header fields are big-endian
+    if magic == _FAT_MAGIC_64:
+        arch_format, arch_size = '>iIQQ', 32
+    else:
+        arch_format, arch_size = '>iIII', 20
+    if nfat_arch == 0 or 8 + nfat_arch * arch_size > len(data):
+        return None
+    
+    slices = [struct.unpack_from(arch_format, data, 8 + i * arch_size)
+              for i in range(nfat_arch)]
+    for cputype, _, offset, _ in slices:
+        if cputype == _CPU_TYPE_ARM64:
+            return offset
+    return slices[0][2]
+
+def _macho_scan_ranges(data):
+    """Return (start, end) ranges of the Mach-O sections to scan, or the whole file"""
+    whole_file = [(0, len(data))]
+    base = _macho_slice_offset(data)
+    if base is None or base + 28 > len(data):
+        return whole_file
+    
+    magic, = struct.unpack_from('<I', data, base)
+    if magic == _MH_MAGIC_64:
+        header_size, segment_cmd = 32, _LC_SEGMENT_64
+        segment_format, segment_size = '<II16sQQQQiiII', 72
+        section_format, section_size = '<16s16sQQII', 80
+    elif magic == _MH_MAGIC:
+        header_size, segment_cmd = 28, _LC_SEGMENT
+        segment_format, segment_size = '<II16sIIIIiiII', 56
+        section_format, section_size = '<16s16sIIII', 68
+    else:
+        return whole_file
+    
+    ncmds, = struct.unpack_from('<I', data, base + 16)
+    ranges = []
+    cmd_offset = base + header_size
+    for _ in range(ncmds):
+        if cmd_offset + 8 > len(data):
+            break
+        cmd, cmdsize = struct.unpack_from('<II', data, cmd_offset)
+        if cmdsize < 8:
+            break
+        
+        if cmd == segment_cmd and cmd_offset + segment_size <= len(data):
+            nsects = struct.unpack_from(segment_format, data, cmd_offset)[9]
+            section_offset = cmd_offset + segment_size
+            for _ in range(nsects):
+                if section_offset + section_size > len(data):
+                    break
+                sectname, segname, _, size, offset, _ = struct.unpack_from(
+                    section_format, data, section_offset)
+                key = (segname.rstrip(b'\0'), sectname.rstrip(b'\0'))
+                # Zero-fill sections have no file contents
+                if key in _MACHO_SCAN_SECTIONS and offset and size:
+                    start = base + offset
+                    ranges.append((start, min(start + size, len(data))))
+                section_offset += section_size
+        
+        cmd_offset += cmdsize
+    
+    return sorted(ranges) or whole_file
+
+def _find_signature(data, signature, has_trailing_tag, start, end):
+    """Yield (offset, signature, has_trailing_tag) for every occurrence of signature in a range, overlaps included"""
+    offset = data.find(signature, start, end)
+    while offset != -1:
+        yield offset, signature, has_trailing_tag
+        offset = data.find(signature, offset + 1, end)
+
+def _find_pattern_hits(binary_data, start, end):
+    """Yield (start, end) offsets of protobuf pattern matches in a range, in start order"""
+    if _PROTOBUF_DB is not None:
+        hits = []
+        
+        def on_match(pattern_id, hit_start, hit_end, flags, context):
+            hits.append((start + hit_start, start + hit_end))
+        
+        with memoryview(binary_data) as view, view[start:end] as section:
+            _PROTOBUF_DB.scan(section, match_event_handler=on_match)
+        yield from hits
+        return
+    
+    for match in _PROTOBUF_RE.finditer(binary_data, start, end):
+        yield match.start(), match.end()
+
+def scan_protobuf_strings(binary_path):
+    """Return protobuf-related strings and candidate message/service names in a binary"""
+    found_runs = set()
+    found_names = set()
+    messages = set()
+    services = set()
+    
+    # Jump from match to match and widen each one to its printable ASCII
+    # run, so only runs that contain a pattern are ever touched from Python.
+    # Only the Mach-O sections that can hold strings are searched.
+    with _map_file(binary_path) as binary_data:
+        for range_start, range_end in _macho_scan_ranges(binary_data):
+            position = range_start
+            for hit_start, hit_end in _find_pattern_hits(binary_data, range_start, range_end):
+                if hit_start < position:
+                    # Part of a run that was already widened and recorded
+                    continue
+                
+                start_match = _RUN_START_RE.match(binary_data, position, hit_start)
+                start = start_match.end() if start_match else position
+                end = _RUN_END_RE.match(binary_data, hit_end, range_end).end()
+                position = end
+                
+                # Names repeat across a binary; only new runs are classified
+                run = binary_data[start:end]
+                if run in found_runs:
+                    continue
+                found_runs.add(run)
+                
+                # Qualified or embedded names are split into identifier
+                # tokens so each one can be bucketed on its own
+                for token in _NAME_TOKEN_RE.findall(binary_data, start, end):
+                    found_names.add(token)
+                    if token.startswith(b'_'):
+                        continue
+                    if _MESSAGE_KIND_RE.search(token):
+                        messages.add(token.decode('ascii'))
+                    if b'Service' in token:
+                        services.add(token.decode('ascii'))
+    
+    # Whole runs and the identifiers inside them are both reported. Runs are
+    # printable ASCII, so they are decoded once at the end
+    found_strings = {string.decode('ascii') for string in found_runs | found_names}
+    return found_strings, messages, services
+
+def scan_framework_strings(binary_path, strings_file):
+    """Write a framework binary's protobuf strings to strings_file and return the result counts"""
+    found_strings, messages, services = scan_protobuf_strings(binary_path)
+    
+    # Written by the worker so only the counts go back to the parent process
+    with open(strings_file, 'w') as f:
+        for string in sorted(found_strings):
+            f.write(string + '\n')
+    
+    return {
+        'protobuf_strings': len(found_strings),
+        'messages': len(messages),
+        'services': len(services)
+    }
+
 class ProtobufExtractor:
     def __init__(self, ipa_path, output_dir):
         self.ipa_path = Path(ipa_path)
@@ -115,38 +389,85 @@ class ProtobufExtractor:
             'compiled_protobuf_files': [],
             'strings_analysis': [],
             'framework_analysis': [],
-            'descriptor_search': []
+            # Stored as parallel columns; a binary can yield thousands of hits
+            'descriptor_search': {'offset': [], 'signature': [], 'position': [], 'length': []}
         }
+        # App bundle files by suffix, filled by index_app_bundle()
+        self.bundle_files = {'.proto': [], '.pb': []}
+        # Main and framework binaries, also filled by index_app_bundle()
+        self.main_binary = None
+        self.framework_binaries = []
         
     def extract_ipa(self):
-        """Extract IPA file to temporary directory"""
+        """Extract the parts of the IPA file needed for analysis"""
         logger.info("Extracting IPA file...")
         self.temp_dir = self.output_dir / "temp_extract"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
         
         try:
             with zipfile.ZipFile(self.ipa_path, 'r') as zip_ref:
-                zip_ref.extractall(self.temp_dir)
-            
-            # Find the .app bundle
-            app_bundles = list(self.temp_dir.glob("Payload/*.app"))
-            if not app_bundles:
-                raise ValueError("No .app bundle found in IPA")
+                entries = zip_ref.infolist()
+                
+                # Find the .app bundle
+                bundle_prefix = None
+                for info in entries:
+                    match = _APP_BUNDLE_RE.match(info.filename)
+                    if match:
+                        bundle_prefix = match.group(0)
+                        break
+                
+                if bundle_prefix is None:
+                    raise ValueError("No .app bundle found in IPA")
+                
+                self.app_bundle = self.temp_dir / bundle_prefix
+                self.app_bundle.mkdir(parents=True, exist_ok=True)
+                binary_name = self.app_bundle.name.replace('.app', '')
+                
+                # Skip assets and resources; only extract what gets analyzed
+                for info in entries:
+                    if not info.filename.startswith(bundle_prefix):
+                        continue
+                    relative_name = info.filename[len(bundle_prefix):]
+                    if self.is_analyzed_entry(relative_name, binary_name):
+                        zip_ref.extract(info, self.temp_dir)
             
-            self.app_bundle = app_bundles[0]
-            logger.info(f"Found app bundle: {self.app_bundle.name}")
+            logger.info("Found app bundle: %s", self.app_bundle.name)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to extract IPA: {e}")
+            logger.error("Failed to extract IPA: %s", e)
             return False
     
+    def is_analyzed_entry(self, name, binary_name):
+        """Check if an app bundle entry is read by any analysis method"""
+        if name.endswith('/'):
+            return False
+        if name.endswith(('.proto', '.pb')) or name == binary_name:
+            return True
+        return _is_framework_binary(name.split('/'))
+    
+    def index_app_bundle(self):
+        """Collect .proto and .pb files and the binaries from the app bundle in a single walk"""
+        binary_name = self.app_bundle.name.replace('.app', '')
+        
+        for entry in _walk_files(self.app_bundle):
+            suffix = os.path.splitext(entry.name)[1]
+            if suffix in self.bundle_files:
+                self.bundle_files[suffix].append(entry)
+                continue
+            
+            parts = os.path.relpath(entry.path, self.app_bundle).split(os.sep)
+            if parts == [binary_name]:
+                self.main_binary = Path(entry.path)
+            elif _is_framework_binary(parts):
+                self.framework_binaries.append(entry)
+    
     def search_direct_proto_files(self):
         """Search for direct .proto files in the app bundle"""
         logger.info("Searching for direct .proto files...")
-        proto_files = list(self.app_bundle.rglob("*.proto"))
         
-        for proto_file in proto_files:
+        for entry in self.bundle_files['.proto']:
+            proto_file = Path(entry.path)
             try:
                 with open(proto_file, 'r', encoding='utf-8', errors='ignore') as f:
                     content = f.read()
@@ -159,99 +480,58 @@ class ProtobufExtractor:
                 
                 self.results['direct_proto_files'].append({
                     'file': str(proto_file.relative_to(self.app_bundle)),
-                    'size': proto_file.stat().st_size,
+                    'size': entry.stat(follow_symlinks=False).st_size,
                     'output': str(output_file.relative_to(self.output_dir))
                 })
                 
             except Exception as e:
-                logger.warning(f"Failed to process proto file {proto_file}: {e}")
+                logger.warning("Failed to process proto file %s: %s", proto_file, e)
     
     def search_compiled_protobuf_files(self):
         """Search for compiled protobuf files (.pb)"""
         logger.info("Searching for compiled protobuf files...")
-        pb_files = list(self.app_bundle.rglob("*.pb"))
         
-        for pb_file in pb_files:
+        for entry in self.bundle_files['.pb']:
+            pb_file = Path(entry.path)
             try:
                 output_file = self.output_dir / "compiled_protobufs" / pb_file.name
                 output_file.parent.mkdir(parents=True, exist_ok=True)
                 
-                # Copy the file
-                with open(pb_file, 'rb') as src, open(output_file, 'wb') as dst:
-                    dst.write(src.read())
+                # Copy the file; copyfile uses the platform's fastest
+                # kernel-side copy (sendfile, fcopyfile) when available
+                shutil.copyfile(pb_file, output_file)
                 
                 self.results['compiled_protobuf_files'].append({
                     'file': str(pb_file.relative_to(self.app_bundle)),
-                    'size': pb_file.stat().st_size,
+                    'size': entry.stat(follow_symlinks=False).st_size,
                     'output': str(output_file.relative_to(self.output_dir))
                 })
                 
             except Exception as e:
-                logger.warning(f"Failed to process pb file {pb_file}: {e}")
+                logger.warning("Failed to process pb file %s: %s", pb_file, e)
     
     def analyze_main_binary(self):
         """Analyze the main binary for protobuf strings"""
         logger.info("Analyzing main binary...")
         
-        # Find main executable
-        binary_name = self.app_bundle.name.replace('.app', '')
-        binary_path = self.app_bundle / binary_name
+        binary_path = self.main_binary
         
-        if not binary_path.exists():
-            logger.warning(f"Main binary not found: {binary_path}")
+        if binary_path is None:
+            logger.warning("Main binary not found in: %s", self.app_bundle.name)
             return
         
         try:
-            logger.info(f"Analyzing binary: {binary_name}")
+            logger.info("Analyzing binary: %s", binary_path.name)
             self.extract_strings_from_binary(binary_path)
         except Exception as e:
-            logger.error(f"Failed to analyze binary: {e}")
+            logger.error("Failed to analyze binary: %s", e)
     
     def extract_strings_from_binary(self, binary_path):
         """Extract protobuf-related strings from binary"""
         logger.info("Performing strings analysis...")
         
         try:
-            with open(binary_path, 'rb') as f:
-                binary_data = f.read()
-            
-            # Protobuf-related patterns
-            protobuf_patterns = [
-                rb'\.proto',
-                rb'protobuf',
-                rb'Request',
-                rb'Response',
-                rb'Message',
-                rb'Service',
-                rb'rpc ',
-                rb'message ',
-                rb'service ',
-                rb'google\.protobuf',
-                rb'SwiftProtobuf',
-                rb'UnitySwiftProtobuf',
-                rb'_protobuf',
-                rb'Protobuf',
-                rb'API\w*Request',
-                rb'API\w*Response',
-            ]
-            
-            found_strings = set()
-            
-            # Extract strings using various methods
-            for i in range(len(binary_data) - 4):
-                # Look for printable strings
-                for min_length in [4, 8, 16]:
-                    if i + min_length <= len(binary_data):
-                        potential_string = binary_data[i:i+min_length]
-                        if self.is_printable_string(potential_string):
-                            # Extend the string
-                            end = i + min_length
-                            while end < len(binary_data) and binary_data[end:end+1].isalnum() or binary_data[end:end+1] in b'._':
-                                end += 1
-                            
-                            full_string = binary_data[i:end]
-                            if self.contains_protobuf_pattern(full_string, protobuf_patterns):
-                                found_strings.add(full_string.decode('utf-8', errors='ignore'))
+            found_strings, messages, services = scan_protobuf_strings(binary_path)
             
             # Save protobuf strings
             strings_dir = self.output_dir / "strings_analysis"
@@ -263,47 +543,17 @@ class ProtobufExtractor:
                     f.write(string + '\n')
             
             # Generate reconstructed proto file
-            self.generate_reconstructed_proto(found_strings, strings_dir)
+            self.generate_reconstructed_proto(messages, services, strings_dir)
             
-            logger.info(f"Found {len(found_strings)} protobuf-related strings")
+            logger.info("Found %d protobuf-related strings", len(found_strings))
             
         except Exception as e:
-            logger.error(f"String analysis failed: {e}")
+            logger.error("String analysis failed: %s", e)
     
-    def is_printable_string(self, data):
-        """Check if data represents a printable string"""
-        try:
-            decoded = data.decode('utf-8')
-            return all(c.isprintable() or c.isspace() for c in decoded)
-        except:
-            return False
-    
-    def contains_protobuf_pattern(self, data, patterns):
-        """Check if data contains protobuf-related patterns"""
-        for pattern in patterns:
-            if pattern in data:
-                return True
-        return False
-    
-    def generate_reconstructed_proto(self, strings, output_dir):
-        """Generate a reconstructed .proto file from found strings"""
+    def generate_reconstructed_proto(self, messages, services, output_dir):
+        """Generate a reconstructed .proto file from found message and service names"""
         logger.info("Generating reconstructed proto file...")
         
-        messages = set()
-        services = set()
-        rpcs = set()
-        
-        for string in strings:
-            # Look for message patterns
-            if 'Request' in string and not string.startswith('_'):
-                messages.add(string.strip())
-            if 'Response' in string and not string.startswith('_'):
-                messages.add(string.strip())
-            if 'Message' in string and not string.startswith('_'):
-                messages.add(string.strip())
-            if 'Service' in string and not string.startswith('_'):
-                services.add(string.strip())
-        
         # Generate proto file
         proto_content = 'syntax = "proto3";\n\n'
         
@@ -328,13 +578,7 @@ class ProtobufExtractor:
     
     def is_valid_message_name(self, name):
         """Check if string is a valid protobuf message name"""
-        if len(name) < 3 or len(name) > 100:
-            return False
-        if not name[0].isupper():
-            return False
-        if not all(c.isalnum() or c == '_' for c in name):
-            return False
-        return True
+        return _VALID_NAME(name) is not None
     
     def is_valid_service_name(self, name):
         """Check if string is a valid protobuf service name"""
@@ -343,96 +587,167 @@ class ProtobufExtractor:
     def search_frameworks(self):
         """Search frameworks for protobuf usage"""
         logger.info("Searching frameworks for protobufs...")
-        frameworks_dir = self.app_bundle / "Frameworks"
+        framework_binaries = self.framework_binaries
         
-        if not frameworks_dir.exists():
-            logger.info("No Frameworks directory found")
+        if not framework_binaries:
+            logger.info("No framework binaries found")
             return
         
-        for framework in frameworks_dir.iterdir():
-            if framework.is_dir() and framework.suffix == '.framework':
-                self.analyze_framework(framework)
+        # One strings file per framework, next to the main binary's results
+        strings_dir = self.output_dir / "strings_analysis" / "frameworks"
+        strings_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Workers get plain paths; DirEntry objects cannot be pickled
+        scans = [(entry.path, strings_dir / f"{entry.name}.txt")
+                 for entry in framework_binaries]
+        for entry, (_, strings_file), outcome in zip(
+                framework_binaries, scans, self.scan_framework_binaries(scans)):
+            framework = Path(entry.path).parent
+            if isinstance(outcome, Exception):
+                logger.warning("Failed to analyze framework %s: %s", framework, outcome)
+            else:
+                self.analyze_framework(framework, entry, strings_file, outcome)
+    
+    def scan_framework_binaries(self, scans):
+        """Return the scan counts, or the exception raised, for each (binary_path, strings_file) pair"""
+        try:
+            # Framework binaries are independent, so scan them on all cores
+            with ProcessPoolExecutor() as executor:
+                futures = [executor.submit(scan_framework_strings, binary_path, strings_file)
+                           for binary_path, strings_file in scans]
+                outcomes = [future.exception() or future.result() for future in futures]
+            
+            for outcome in outcomes:
+                if isinstance(outcome, BrokenProcessPool):
+                    raise outcome
+            return outcomes
+        
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.warning("Process pool unavailable (%s), scanning frameworks serially", e)
+        
+        outcomes = []
+        for binary_path, strings_file in scans:
+            try:
+                outcomes.append(scan_framework_strings(binary_path, strings_file))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
     
-    def analyze_framework(self, framework_path):
-        """Analyze individual framework for protobuf content"""
+    def analyze_framework(self, framework_path, binary_entry, strings_file, counts):
+        """Record scan results for an individual framework"""
         try:
-            # Look for binary in framework
             framework_name = framework_path.name.replace('.framework', '')
-            binary_path = framework_path / framework_name
+            logger.info("Analyzing framework: %s", framework_name)
             
-            if binary_path.exists():
-                logger.info(f"Analyzing framework: {framework_name}")
-                # Perform basic analysis
-                self.results['framework_analysis'].append({
-                    'framework': framework_name,
-                    'path': str(framework_path.relative_to(self.app_bundle)),
-                    'binary_size': binary_path.stat().st_size if binary_path.exists() else 0
-                })
+            entry = {
+                'framework': framework_name,
+                'path': str(framework_path.relative_to(self.app_bundle)),
+                'binary_size': binary_entry.stat(follow_symlinks=False).st_size,
+                'strings_file': str(strings_file.relative_to(self.output_dir))
+            }
+            entry.update(counts)
+            self.results['framework_analysis'].append(entry)
         except Exception as e:
-            logger.warning(f"Failed to analyze framework {framework_path}: {e}")
+            logger.warning("Failed to analyze framework %s: %s", framework_path, e)
     
     def search_protobuf_descriptors(self):
         """Search for protobuf descriptor signatures in binaries"""
         logger.info("Searching for protobuf descriptors...")
         
-        binary_name = self.app_bundle.name.replace('.app', '')
-        binary_path = self.app_bundle / binary_name
+        binary_path = self.main_binary
         
-        if not binary_path.exists():
+        if binary_path is None:
             return
         
         try:
-            with open(binary_path, 'rb') as f:
-                binary_data = f.read()
-            
-            # Look for protobuf descriptor signatures
-            descriptor_signatures = [
-                b'\x08\x96\x01\x12',  # Common protobuf descriptor pattern
-                b'\x0a\x04',          # String field pattern
-                b'\x12\x04',          # Another common pattern
-            ]
-            
             descriptor_dir = self.output_dir / "binary_analysis"
             descriptor_dir.mkdir(parents=True, exist_ok=True)
             
-            for i, signature in enumerate(descriptor_signatures):
-                offset = 0
-                count = 0
-                while True:
-                    offset = binary_data.find(signature, offset)
-                    if offset == -1:
-                        break
+            offsets = self.results['descriptor_search']['offset']
+            signatures = self.results['descriptor_search']['signature']
+            positions = self.results['descriptor_search']['position']
+            lengths = self.results['descriptor_search']['length']
+            
+            # All descriptors go into one buffered file instead of one file
+            # per hit; descriptors_index.csv records where each one starts
+            descriptors_file = descriptor_dir / "descriptors.bin"
+            position = 0
+            count = 0
+            with _map_file(binary_path) as binary_data, \
+                    open(descriptors_file, 'wb', buffering=1 << 20) as out:
+                # Serialized descriptors live in the constant data sections
+                # find() is a memchr-backed scan, far faster than a regex
+                # alternation; merge the per-signature hits in offset order
+                matches = chain.from_iterable(
+                    heapq.merge(*(_find_signature(binary_data, signature, has_trailing_tag, start, end)
+                                  for signature, has_trailing_tag in _DESCRIPTOR_SIGNATURES))
+                    for start, end in _macho_scan_ranges(binary_data)
+                )
+                for offset, signature, has_trailing_tag in matches:
                     
-                    # Extract potential descriptor
-                    descriptor_data = binary_data[offset:offset+1024]  # Extract 1KB
+                    if len(binary_data) - offset < 64:  # Minimum size check
+                        continue
                     
-                    if len(descriptor_data) >= 64:  # Minimum size check
-                        descriptor_file = descriptor_dir / f"descriptor_{offset:08x}.desc"
-                        with open(descriptor_file, 'wb') as f:
-                            f.write(descriptor_data)
-                        
-                        self.results['descriptor_search'].append({
-                            'offset': hex(offset),
-                            'signature': signature.hex(),
-                            'file': str(descriptor_file.relative_to(self.output_dir))
-                        })
-                        count += 1
+                    # Two-byte signatures occur all over machine code; keep
+                    # only hits that are followed by a real string field
+                    if not self.is_plausible_descriptor(binary_data, offset, signature, has_trailing_tag):
+                        continue
                     
-                    offset += 1
-                
-                if count > 0:
-                    logger.info(f"Found descriptor signature in: {binary_name}")
+                    # Extract potential descriptor (1KB)
+                    descriptor_data = binary_data[offset:offset+1024]
+                    out.write(descriptor_data)
+                    
+                    offsets.append(offset)
+                    signatures.append(signature)
+                    positions.append(position)
+                    lengths.append(len(descriptor_data))
+                    position += len(descriptor_data)
+                    count += 1
+                    
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Descriptor signature %s at offset %#x",
+                                     signature.hex(), offset)
+            
+            with open(descriptor_dir / "descriptors_index.csv", 'w') as f:
+                f.write('offset,signature,position,length\n')
+                for offset, signature, start, length in zip(offsets, signatures, positions, lengths):
+                    f.write(f"{offset:#x},{signature.hex()},{start},{length}\n")
+            
+            if count > 0:
+                logger.info("Found descriptor signature in: %s", binary_path.name)
         
         except Exception as e:
-            logger.error(f"Descriptor search failed: {e}")
+            logger.error("Descriptor search failed: %s", e)
+    
+    def is_plausible_descriptor(self, data, offset, signature, has_trailing_tag):
+        """Check if a signature hit is followed by a printable length-prefixed string"""
+        end = offset + len(signature)
+        if has_trailing_tag:
+            # Signature ends with a length-delimited field tag
+            if end >= len(data):
+                return False
+            length = data[end]
+            end += 1
+        else:
+            # Signature ends with the string field's length byte
+            length = signature[-1]
+        
+        # Only single-byte varint lengths are considered
+        if length == 0 or length & 0x80:
+            return False
+        
+        value = data[end:end + length]
+        return len(value) == length and _PRINTABLE_RE.fullmatch(value) is not None
     
     def generate_summary_report(self):
         """Generate summary report"""
         logger.info("Summary report generated")
         
+        descriptors = self.results['descriptor_search']
+        descriptor_count = len(descriptors['offset'])
+        # Descriptors are entries in descriptors.bin, not separate files
         total_files = (len(self.results['direct_proto_files']) + 
-                      len(self.results['compiled_protobuf_files']) + 
-                      len(self.results['descriptor_search']))
+                      len(self.results['compiled_protobuf_files']))
         
         # Generate text summary
         summary_text = f"""IPA Protobuf Extraction Report
@@ -447,14 +762,14 @@ direct_proto_files: {len(self.results['direct_proto_files'])} files
 compiled_protobuf_files: {len(self.results['compiled_protobuf_files'])} files
 strings_analysis: {len(self.results['strings_analysis'])} files
 framework_analysis: {len(self.results['framework_analysis'])} files
-descriptor_search: {len(self.results['descriptor_search'])} files
+descriptor_search: {descriptor_count} entries (binary_analysis/descriptors.bin)
 
 Output Structure:
 ---------------
 proto_files/          - Direct .proto files found
 compiled_protobufs/   - Compiled protobuf files (.pb)
 binary_analysis/      - Binary analysis results
-strings_analysis/     - String extraction results
+strings_analysis/     - String extraction results (frameworks/ per framework)
 extraction_summary.json - This summary in JSON format"""
 
         # Save text summary
@@ -471,20 +786,34 @@ extraction_summary.json - This summary in JSON format"""
                 'compiled_protobuf_files': len(self.results['compiled_protobuf_files']),
                 'strings_analysis': len(self.results['strings_analysis']),
                 'framework_analysis': len(self.results['framework_analysis']),
-                'descriptor_search': len(self.results['descriptor_search'])
+                'descriptor_search': descriptor_count
             },
-            'total_files_found': total_files
+            'total_files_found': total_files,
+            'total_descriptors_found': descriptor_count,
+            'frameworks': self.results['framework_analysis'],
+            'descriptors': [
+                {
+                    'offset': hex(offset),
+                    'signature': signature.hex(),
+                    'file': "binary_analysis/descriptors.bin",
+                    'position': position,
+                    'length': length
+                }
+                for offset, signature, position, length in zip(
+                    descriptors['offset'], descriptors['signature'],
+                    descriptors['position'], descriptors['length'])
+            ]
         }
         
         with open(self.output_dir / "extraction_summary.json", 'w') as f:
             json.dump(json_summary, f, indent=2)
         
-        logger.info(f"Total protobuf artifacts found: {total_files}")
+        logger.info("Total protobuf files found: %d", total_files)
+        logger.info("Total descriptor entries found: %d", descriptor_count)
     
     def cleanup(self):
         """Clean up temporary files"""
         if self.temp_dir and self.temp_dir.exists():
-            import shutil
             shutil.rmtree(self.temp_dir)
     
     def extract(self):
@@ -498,6 +827,7 @@ extraction_summary.json - This summary in JSON format"""
                 return False
             
             # Run all extraction methods
+            self.index_app_bundle()
             self.search_direct_proto_files()
             self.search_compiled_protobuf_files()
             self.analyze_main_binary()
@@ -507,11 +837,11 @@ extraction_summary.json - This summary in JSON format"""
             # Generate summary
             self.generate_summary_report()
             
-            logger.info(f"Extraction complete. Results saved to: {self.output_dir}")
+            logger.info("Extraction complete. Results saved to: %s", self.output_dir)
             return True
             
         except Exception as e:
-            logger.error(f"Extraction failed: {e}")
+            logger.error("Extraction failed: %s", e)
             return False
         finally:
             self.cleanup()
@@ -549,17 +879,17 @@ Website: {__website__}
     # Validate IPA file
     ipa_path = Path(args.ipa_file)
     if not ipa_path.exists():
-        logger.error(f"IPA file not found: {ipa_path}")
+        logger.error("IPA file not found: %s", ipa_path)
         sys.exit(1)
     
     if not ipa_path.suffix.lower() == '.ipa':
-        logger.error(f"File is not an IPA: {ipa_path}")
+        logger.error("File is not an IPA: %s", ipa_path)
         sys.exit(1)
     
     # Run extraction
     extractor = ProtobufExtractor(ipa_path, args.output_dir)
     
-    logger.info(f"Starting protobuf extraction from: {ipa_path.name}")
+    logger.info("Starting protobuf extraction from: %s", ipa_path.name)
     
     if extractor.extract():
         print(f"\nExtraction completed successfully!")